@@ -6,12 +6,13 @@ The only requirement from an action is for it to have a take_action method.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import gzip
 import json
 import logging
-import smtplib
-import ssl
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -23,6 +24,7 @@ from typing import (
 )
 
 import requests
+from requests.adapters import Retry
 from typing_extensions import dataclass_transform
 
 from great_expectations._docs_decorators import public_api
@@ -39,8 +41,8 @@ from great_expectations.compatibility.pydantic import (
     root_validator,
     validator,
 )
-from great_expectations.compatibility.pypd import pypd
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.http import DEFAULT_TIMEOUT, _TimeoutHTTPAdapter
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.data_context.context_factory import project_manager
 from great_expectations.data_context.types.resource_identifiers import (
@@ -65,6 +67,9 @@ from great_expectations.render.renderer.renderer import Renderer
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251 # FIXME CoP
 
 if TYPE_CHECKING:
+    import smtplib
+    import ssl
+
     from great_expectations.checkpoint.checkpoint import CheckpointResult
     from great_expectations.core.expectation_validation_result import (
         ExpectationSuiteValidationResult,
@@ -73,6 +78,140 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+_NOTIFICATION_RETRY_COUNT = 3
+_SLACK_MAX_BLOCKS_PER_MESSAGE = 50
+_PAGERDUTY_EVENTS_URL = "https://events.pagerduty.com/v2/enqueue"
+_SMTP_IDLE_TIMEOUT_SECONDS = 100
+_SMTP_TIMEOUT_SECONDS = 20
+_API_COMPRESSION_MIN_BYTES = 4096
+_SMTP_OK = 250
+
+
+class _NotificationHTTPAdapter(_TimeoutHTTPAdapter):
+    @override
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:  # type: ignore[override] # FIXME CoP
+        # Session.request always forwards timeout=None, which would otherwise disable the default
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def _build_notification_session() -> requests.Session:
+    # Connection errors are retried; urllib3 does not retry POSTs on error status codes.
+    retries = Retry(total=_NOTIFICATION_RETRY_COUNT, backoff_factor=0.2)
+    adapter = _NotificationHTTPAdapter(
+        timeout=DEFAULT_TIMEOUT, pool_connections=10, pool_maxsize=50, max_retries=retries
+    )
+    session = requests.Session()
+    for protocol in ("http://", "https://"):
+        session.mount(protocol, adapter)
+    return session
+
+
+# Shared across notification actions so repeat webhooks reuse pooled keep-alive connections
+_NOTIFICATION_SESSION = _build_notification_session()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ssl_context() -> ssl.SSLContext:
+    # Built on first use so importing this module does not load the CA bundle
+    import ssl
+
+    return ssl.create_default_context()
+
+
+@functools.cache
+def _get_sns_client(**session_kwargs: str) -> Any:
+    # botocore clients are thread-safe, so one per session configuration is shared;
+    # building a Session re-reads credentials and config files from disk. The client lives for
+    # the whole process, so rotated static credentials or a changed default region in the
+    # environment are not picked up until it is restarted.
+    return aws.boto3.Session(**session_kwargs).client("sns")
+
+
+def _quit_smtp_quietly(mailserver: smtplib.SMTP) -> None:
+    try:
+        mailserver.quit()
+    except Exception:
+        logger.debug("Failed to close SMTP connection", exc_info=True)
+
+
+def _close_smtp_quietly(mailserver: smtplib.SMTP) -> None:
+    # Drops the socket without a QUIT round trip, for connections that are stale or failed
+    try:
+        mailserver.close()
+    except Exception:
+        logger.debug("Failed to close SMTP connection", exc_info=True)
+
+
+def _sendmail_or_close(
+    mailserver: smtplib.SMTP, from_addr: str, to_addrs: list[str], message: str
+) -> None:
+    try:
+        mailserver.sendmail(from_addr, to_addrs, message)
+    except Exception:
+        _close_smtp_quietly(mailserver)
+        raise
+
+
+class _SMTPConnectionCache:
+    """Keeps authenticated SMTP connections open between sends to the same server.
+
+    Connections are checked out for exclusive use and checked back in after a successful send,
+    so concurrent checkpoints never share one. Idle or unresponsive connections are dropped.
+    """
+
+    def __init__(self, idle_timeout: float) -> None:
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._connections: dict[tuple, tuple[smtplib.SMTP, float]] = {}
+
+    def checkout(self, key: tuple) -> smtplib.SMTP | None:
+        with self._lock:
+            entry = self._connections.pop(key, None)
+        if entry is None:
+            return None
+
+        mailserver, last_used = entry
+        if self._is_expired(last_used) or not self._is_alive(mailserver):
+            _close_smtp_quietly(mailserver)
+            return None
+        return mailserver
+
+    def checkin(self, key: tuple, mailserver: smtplib.SMTP) -> None:
+        with self._lock:
+            previous = self._connections.pop(key, None)
+            self._connections[key] = (mailserver, time.monotonic())
+        if previous is not None:
+            _quit_smtp_quietly(previous[0])
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._connections.values())
+            self._connections.clear()
+        for mailserver, last_used in entries:
+            if self._is_expired(last_used):
+                # The server has most likely dropped it already, so a QUIT would only wait
+                _close_smtp_quietly(mailserver)
+            else:
+                _quit_smtp_quietly(mailserver)
+
+    def _is_expired(self, last_used: float) -> bool:
+        return time.monotonic() - last_used > self._idle_timeout
+
+    @staticmethod
+    def _is_alive(mailserver: smtplib.SMTP) -> bool:
+        try:
+            code, _ = mailserver.noop()
+        except Exception:
+            return False
+        return code == _SMTP_OK
+
+
+_SMTP_CONNECTIONS = _SMTPConnectionCache(idle_timeout=_SMTP_IDLE_TIMEOUT_SECONDS)
+atexit.register(_SMTP_CONNECTIONS.close_all)
+
+
 def _build_renderer(config: dict) -> Renderer:
     renderer = instantiate_class_from_config(
         config=config,
@@ -242,8 +381,6 @@ class ValidationAction(BaseModel, metaclass=MetaValidationAction):
 
     @staticmethod
     def _substitute_config_str_if_needed(value: Union[str, ConfigStr, None]) -> Optional[str]:
-        from great_expectations.data_context.data_context.context_factory import project_manager
-
         config_provider = project_manager.get_config_provider()
         if isinstance(value, ConfigStr):
             return value.get_config_value(config_provider=config_provider)
@@ -369,6 +506,8 @@ class SlackNotificationAction(DataDocsAction):
         if not _should_notify(success=success, notify_on=self.notify_on):
             return result
 
+        data_docs_pages = self._get_data_docs_pages_from_prior_action(action_context=action_context)
+
         checkpoint_text_blocks: list[dict] = []
         for (
             validation_result_suite_identifier,
@@ -377,7 +516,7 @@ class SlackNotificationAction(DataDocsAction):
             validation_text_blocks = self._render_validation_result(
                 result_identifier=validation_result_suite_identifier,
                 result=validation_result_suite,
-                action_context=action_context,
+                data_docs_pages=data_docs_pages,
             )
             checkpoint_text_blocks.extend(validation_text_blocks)
 
@@ -389,7 +528,10 @@ class SlackNotificationAction(DataDocsAction):
             run_id=checkpoint_result.run_id,
         )
 
-        result = self._send_slack_notification(payload=payload)
+        for batch in self._batch_payload(payload=payload):
+            result = self._send_slack_notification(payload=batch)
+            if result["slack_notification_result"] is None:
+                break
 
         checkpoint = checkpoint_result.checkpoint_config
         submit_event(
@@ -404,14 +546,8 @@ class SlackNotificationAction(DataDocsAction):
         self,
         result_identifier: ValidationResultIdentifier,
         result: ExpectationSuiteValidationResult,
-        action_context: ActionContext | None = None,
+        data_docs_pages: dict[ValidationResultIdentifier, dict[str, str]] | None = None,
     ) -> list[dict]:
-        data_docs_pages = None
-        if action_context:
-            data_docs_pages = self._get_data_docs_pages_from_prior_action(
-                action_context=action_context
-            )
-
         # Assemble complete GX Cloud URL for a specific validation result
         data_docs_urls: list[dict[str, str]] = self._get_docs_sites_urls(
             resource_identifier=result_identifier
@@ -433,12 +569,24 @@ class SlackNotificationAction(DataDocsAction):
             validation_result_urls=validation_result_urls,
         )
 
+    @staticmethod
+    def _batch_payload(payload: dict) -> list[dict]:
+        # Slack rejects messages with more than 50 blocks, so large checkpoints are split
+        # into consecutive messages that each stay within the limit.
+        blocks = payload.get("blocks") or []
+        if len(blocks) <= _SLACK_MAX_BLOCKS_PER_MESSAGE:
+            return [payload]
+
+        return [
+            {**payload, "blocks": blocks[i : i + _SLACK_MAX_BLOCKS_PER_MESSAGE]}
+            for i in range(0, len(blocks), _SLACK_MAX_BLOCKS_PER_MESSAGE)
+        ]
+
     def _send_slack_notification(self, payload: dict) -> dict:
         slack_webhook = self._substitute_config_str_if_needed(self.slack_webhook)
         slack_token = self._substitute_config_str_if_needed(self.slack_token)
         slack_channel = self._substitute_config_str_if_needed(self.slack_channel)
 
-        session = requests.Session()
         url = slack_webhook
         headers = None
 
@@ -456,10 +604,12 @@ class SlackNotificationAction(DataDocsAction):
             raise ValueError("No Slack webhook URL provided.")  # noqa: TRY003 # FIXME CoP
 
         try:
-            response = session.post(url=url, headers=headers, json=payload)
+            response = _NOTIFICATION_SESSION.post(url=url, headers=headers, json=payload)
             response.raise_for_status()
         except requests.ConnectionError:
-            logger.warning(f"Failed to connect to Slack webhook after {10} retries.")
+            logger.warning(
+                f"Failed to connect to Slack webhook after {_NOTIFICATION_RETRY_COUNT} retries."
+            )
             return {"slack_notification_result": None}
         except requests.HTTPError:
             logger.warning(
@@ -485,7 +635,7 @@ class PagerdutyAlertAction(ValidationAction):
     ```
 
     Args:
-        api_key: Events API v2 key for pagerduty.
+        api_key: PagerDuty API key. Not sent with events; Events API v2 authenticates with routing_key.
         routing_key: The 32 character Integration Key for an integration on a service or on a global ruleset.
         notify_on: Specifies validation status that triggers notification. One of "all", "failure", "success".
         severity: The PagerDuty severity levels determine the level of urgency. One of "critical", "error", "warning", or "info".
@@ -510,27 +660,36 @@ class PagerdutyAlertAction(ValidationAction):
         else:
             summary += "failed"
 
-        return self._run_pypd_alert(dedup_key=checkpoint_name, message=summary, success=success)
-
-    def _run_pypd_alert(self, dedup_key: str, message: str, success: bool):
-        if _should_notify(success=success, notify_on=self.notify_on):
-            pypd.api_key = self.api_key
-            pypd.EventV2.create(
-                data={
-                    "routing_key": self.routing_key,
-                    "dedup_key": dedup_key,
-                    "event_action": "trigger",
-                    "payload": {
-                        "summary": message,
-                        "severity": self.severity,
-                        "source": "Great Expectations",
-                    },
-                }
-            )
+        return self._send_pagerduty_alert(
+            dedup_key=checkpoint_name, message=summary, success=success
+        )
 
-            return {"pagerduty_alert_result": "success"}
+    def _send_pagerduty_alert(self, dedup_key: str, message: str, success: bool) -> dict:
+        if not _should_notify(success=success, notify_on=self.notify_on):
+            return {"pagerduty_alert_result": "none sent"}
 
-        return {"pagerduty_alert_result": "none sent"}
+        payload = {
+            "routing_key": self.routing_key,
+            "dedup_key": dedup_key,
+            "event_action": "trigger",
+            "payload": {
+                "summary": message,
+                "severity": self.severity,
+                "source": "Great Expectations",
+            },
+        }
+
+        try:
+            response = _NOTIFICATION_SESSION.post(url=_PAGERDUTY_EVENTS_URL, json=payload)
+            response.raise_for_status()
+        except requests.ConnectionError as e:
+            logger.warning(f"Failed to connect to PagerDuty: {e}")
+            return {"pagerduty_alert_result": None}
+        except requests.HTTPError as e:
+            logger.warning(f"Request to PagerDuty API returned error {response.status_code}: {e}")  # type: ignore[possibly-undefined] # ok for httperror
+            return {"pagerduty_alert_result": None}
+
+        return {"pagerduty_alert_result": "success"}
 
 
 @public_api
@@ -589,12 +748,14 @@ class MicrosoftTeamsNotificationAction(ValidationAction):
         if not webhook:  # Necessary to appease mypy; this is guaranteed.
             raise ValueError("No Microsoft Teams webhook URL provided.")  # noqa: TRY003 # FIXME CoP
 
-        session = requests.Session()
         try:
-            response = session.post(url=webhook, json=payload)
+            response = _NOTIFICATION_SESSION.post(url=webhook, json=payload)
             response.raise_for_status()
         except requests.ConnectionError:
-            logger.warning("Failed to connect to Microsoft Teams webhook after 10 retries.")
+            logger.warning(
+                "Failed to connect to Microsoft Teams webhook after "
+                f"{_NOTIFICATION_RETRY_COUNT} retries."
+            )
             return None
         except requests.HTTPError as e:
             logger.warning(
@@ -656,13 +817,6 @@ class OpsgenieAlertAction(ValidationAction):
         checkpoint_name = checkpoint_result.checkpoint_config.name
 
         if _should_notify(success=validation_success, notify_on=self.notify_on):
-            settings = {
-                "api_key": self.api_key,
-                "region": self.region,
-                "priority": self.priority,
-                "tags": self.tags,
-            }
-
             description = self.renderer.render(checkpoint_result=checkpoint_result)
 
             message = f"Great Expectations Checkpoint {checkpoint_name} "
@@ -671,34 +825,30 @@ class OpsgenieAlertAction(ValidationAction):
             else:
                 message += "failed!"
 
-            alert_result = self._send_opsgenie_alert(
-                query=description, message=message, settings=settings
-            )
+            alert_result = self._send_opsgenie_alert(query=description, message=message)
 
             return {"opsgenie_alert_result": alert_result}
         else:
             return {"opsgenie_alert_result": "No alert sent"}
 
-    def _send_opsgenie_alert(self, query: str, message: str, settings: dict) -> bool:
+    def _send_opsgenie_alert(self, query: str, message: str) -> bool:
         """Creates an alert in Opsgenie."""
-        if settings["region"] is not None:
+        if self.region is not None:
             # accommodate for Europeans
-            url = f"https://api.{settings['region']}.opsgenie.com/v2/alerts"
+            url = f"https://api.{self.region}.opsgenie.com/v2/alerts"
         else:
             url = "https://api.opsgenie.com/v2/alerts"
 
-        headers = {"Authorization": f"GenieKey {settings['api_key']}"}
+        headers = {"Authorization": f"GenieKey {self.api_key}"}
         payload = {
             "message": message,
             "description": query,
-            "priority": settings["priority"],  # allow this to be modified in settings
-            "tags": settings["tags"],
+            "priority": self.priority,
+            "tags": self.tags,
         }
 
-        session = requests.Session()
-
         try:
-            response = session.post(url, headers=headers, json=payload)
+            response = _NOTIFICATION_SESSION.post(url, headers=headers, json=payload)
             response.raise_for_status()
         except requests.ConnectionError as e:
             logger.warning(f"Failed to connect to Opsgenie: {e}")
@@ -815,9 +965,7 @@ class EmailAction(ValidationAction):
             self._substitute_config_str_if_needed(self.receiver_emails) or ""
         )
 
-        receiver_emails_list = list(
-            map(lambda x: x.strip(), substituted_receiver_emails.split(","))
-        )
+        receiver_emails_list = self._parse_receiver_emails(substituted_receiver_emails)
 
         # this will actually send the email
         email_result = self._send_email(
@@ -836,12 +984,23 @@ class EmailAction(ValidationAction):
         # sending payload back as dictionary
         return {"email_result": email_result}
 
-    def _send_email(  # noqa: C901 # FIXME CoP
+    @staticmethod
+    def _parse_receiver_emails(receiver_emails: str) -> list[str]:
+        # Drops blanks and repeated addresses while keeping the configured order
+        stripped_emails = (email.strip() for email in receiver_emails.split(","))
+        return list(dict.fromkeys(email for email in stripped_emails if email))
+
+    def _send_email(
         self,
         title,
         html,
         receiver_emails_list,
     ):
+        # Deferred so that importing actions does not pull in smtplib and the email package
+        import smtplib
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         smtp_address = self._substitute_config_str_if_needed(self.smtp_address)
         smtp_port = self._substitute_config_str_if_needed(self.smtp_port)
         sender_login = self._substitute_config_str_if_needed(self.sender_login)
@@ -853,27 +1012,25 @@ class EmailAction(ValidationAction):
         msg["To"] = ", ".join(receiver_emails_list)
         msg["Subject"] = title
         msg.attach(MIMEText(html, "html"))
+        connection_key = (
+            smtp_address,
+            smtp_port,
+            sender_login,
+            sender_password,
+            self.use_ssl,
+            self.use_tls,
+        )
         try:
-            if self.use_ssl:
-                if self.use_tls:
-                    logger.warning("Please choose between SSL or TLS, will default to SSL")
-                context = ssl.create_default_context()
-                mailserver = smtplib.SMTP_SSL(smtp_address, smtp_port, context=context)
-            elif self.use_tls:
-                mailserver = smtplib.SMTP(smtp_address, smtp_port)
-                context = ssl.create_default_context()
-                mailserver.starttls(context=context)
-            else:
-                logger.warning("Not using TLS or SSL to send an email is not secure")
-                mailserver = smtplib.SMTP(smtp_address, smtp_port)
-            if sender_login is not None and sender_password is not None:
-                mailserver.login(sender_login, sender_password)
-            elif not (sender_login is None and sender_password is None):
-                logger.error(
-                    "Please specify both sender_login and sender_password or specify both as None"
-                )
-            mailserver.sendmail(sender_alias, receiver_emails_list, msg.as_string())
-            mailserver.quit()
+            mailserver = self._deliver(
+                connection_key=connection_key,
+                smtp_address=smtp_address,
+                smtp_port=smtp_port,
+                sender_login=sender_login,
+                sender_password=sender_password,
+                from_addr=sender_alias,
+                to_addrs=receiver_emails_list,
+                message=msg.as_string(),
+            )
         except smtplib.SMTPConnectError:
             logger.error(f"Failed to connect to the SMTP server at address: {smtp_address}")  # noqa: TRY400 # FIXME CoP
         except smtplib.SMTPAuthenticationError:
@@ -881,8 +1038,79 @@ class EmailAction(ValidationAction):
         except Exception as e:
             logger.error(str(e))  # noqa: TRY400 # FIXME CoP
         else:
+            # Kept open so the next email to this server skips the connect, TLS and login steps
+            _SMTP_CONNECTIONS.checkin(connection_key, mailserver)
             return "success"
 
+    def _deliver(  # noqa: PLR0913 # connection settings plus the message
+        self,
+        connection_key: tuple,
+        smtp_address: str,
+        smtp_port: str,
+        sender_login: str | None,
+        sender_password: str | None,
+        from_addr: str,
+        to_addrs: list[str],
+        message: str,
+    ) -> smtplib.SMTP:
+        import smtplib
+
+        mailserver = _SMTP_CONNECTIONS.checkout(connection_key)
+        if mailserver is not None:
+            try:
+                _sendmail_or_close(mailserver, from_addr, to_addrs, message)
+            except smtplib.SMTPServerDisconnected:
+                # The server can drop a cached connection between the NOOP check and the send
+                logger.debug(f"Cached SMTP connection to {smtp_address} was closed, reconnecting")
+            else:
+                return mailserver
+
+        mailserver = self._connect(
+            smtp_address=smtp_address,
+            smtp_port=smtp_port,
+            sender_login=sender_login,
+            sender_password=sender_password,
+        )
+        _sendmail_or_close(mailserver, from_addr, to_addrs, message)
+        return mailserver
+
+    def _connect(
+        self,
+        smtp_address: str,
+        smtp_port: str,
+        sender_login: str | None,
+        sender_password: str | None,
+    ) -> smtplib.SMTP:
+        import smtplib
+
+        if self.use_ssl:
+            if self.use_tls:
+                logger.warning("Please choose between SSL or TLS, will default to SSL")
+            mailserver = smtplib.SMTP_SSL(
+                smtp_address,
+                smtp_port,
+                timeout=_SMTP_TIMEOUT_SECONDS,
+                context=_get_ssl_context(),
+            )
+        elif self.use_tls:
+            mailserver = smtplib.SMTP(smtp_address, smtp_port, timeout=_SMTP_TIMEOUT_SECONDS)
+        else:
+            logger.warning("Not using TLS or SSL to send an email is not secure")
+            mailserver = smtplib.SMTP(smtp_address, smtp_port, timeout=_SMTP_TIMEOUT_SECONDS)
+        try:
+            if self.use_tls and not self.use_ssl:
+                mailserver.starttls(context=_get_ssl_context())
+            if sender_login is not None and sender_password is not None:
+                mailserver.login(sender_login, sender_password)
+        except Exception:
+            _close_smtp_quietly(mailserver)
+            raise
+        if (sender_login is None) != (sender_password is None):
+            logger.error(
+                "Please specify both sender_login and sender_password or specify both as None"
+            )
+        return mailserver
+
 
 @public_api
 class UpdateDataDocsAction(DataDocsAction):
@@ -920,23 +1148,34 @@ class UpdateDataDocsAction(DataDocsAction):
         self, checkpoint_result: CheckpointResult, action_context: ActionContext | None = None
     ) -> dict:
         action_results: dict[ValidationResultIdentifier, dict[str, str]] = {}
+        if not checkpoint_result.run_results:
+            return action_results
+
+        using_cloud_context = self._using_cloud_context
+        resource_identifiers: list[
+            ValidationResultIdentifier | ExpectationSuiteIdentifier | GXCloudIdentifier
+        ] = []
         for result_identifier, result in checkpoint_result.run_results.items():
             suite_name = result.suite_name
 
             expectation_suite_identifier: ExpectationSuiteIdentifier | GXCloudIdentifier
-            if self._using_cloud_context:
+            if using_cloud_context:
                 expectation_suite_identifier = GXCloudIdentifier(
                     resource_type=GXCloudRESTResource.EXPECTATION_SUITE, resource_name=suite_name
                 )
             else:
                 expectation_suite_identifier = ExpectationSuiteIdentifier(name=suite_name)
 
-            action_result = self._run(
-                validation_result_suite=result,
+            resource_identifiers.extend([result_identifier, expectation_suite_identifier])
+
+        # A single build renders every result and rebuilds each site index once per checkpoint
+        self._build_data_docs(site_names=self.site_names, resource_identifiers=resource_identifiers)
+
+        for result_identifier in checkpoint_result.run_results:
+            action_results[result_identifier] = self._get_data_docs_validation_results(
                 validation_result_suite_identifier=result_identifier,
-                expectation_suite_identifier=expectation_suite_identifier,
+                using_cloud_context=using_cloud_context,
             )
-            action_results[result_identifier] = action_result
 
         return action_results
 
@@ -974,8 +1213,18 @@ class UpdateDataDocsAction(DataDocsAction):
                 expectation_suite_identifier,
             ],
         )
+        return self._get_data_docs_validation_results(
+            validation_result_suite_identifier=validation_result_suite_identifier,
+            using_cloud_context=self._using_cloud_context,
+        )
+
+    def _get_data_docs_validation_results(
+        self,
+        validation_result_suite_identifier: Union[ValidationResultIdentifier, GXCloudIdentifier],
+        using_cloud_context: bool,
+    ) -> dict:
         data_docs_validation_results: dict = {}
-        if self._using_cloud_context:
+        if using_cloud_context:
             return data_docs_validation_results
 
         # get the URL for the validation result
@@ -1022,8 +1271,7 @@ class SNSNotificationAction(ValidationAction):
         msg = self._send_sns_notification(
             sns_subject=self.sns_message_subject or checkpoint_result.name,
             validation_results=json.dumps(
-                [result.to_json_dict() for result in checkpoint_result.run_results.values()],
-                indent=4,
+                [result.to_json_dict() for result in checkpoint_result.run_results.values()]
             ),
         )
         return {"result": msg}
@@ -1051,8 +1299,7 @@ class SNSNotificationAction(ValidationAction):
             },
             "MessageStructure": "json",
         }
-        session = aws.boto3.Session(**kwargs)
-        sns = session.client("sns")
+        sns = _get_sns_client(**kwargs)
         try:
             response = sns.publish(**message_dict)
         except sns.exceptions.InvalidParameterException:
@@ -1069,6 +1316,7 @@ class APINotificationAction(ValidationAction):
     type: Literal["api"] = "api"
 
     url: str
+    compress_payload: bool = False
 
     @override
     def run(
@@ -1093,7 +1341,13 @@ class APINotificationAction(ValidationAction):
     def send_results(self, payload) -> requests.Response:
         try:
             headers = {"Content-Type": "application/json"}
-            return requests.post(self.url, headers=headers, data=payload)
+            # Payload values are already JSON-safe, so a single json.dumps encodes the whole body
+            body = json.dumps(payload).encode("utf-8")
+            if self.compress_payload and len(body) > _API_COMPRESSION_MIN_BYTES:
+                # Opt-in since not every endpoint accepts compressed request bodies
+                headers["Content-Encoding"] = "gzip"
+                body = gzip.compress(body, compresslevel=1)
+            return _NOTIFICATION_SESSION.post(self.url, headers=headers, data=body)
         except Exception as e:
             print(f"Exception when sending data to API - {e}")
             raise e  # noqa: TRY201 # FIXME CoP
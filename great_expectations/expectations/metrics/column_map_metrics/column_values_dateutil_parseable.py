@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from dateutil.parser import parse
 
 from great_expectations.execution_engine import PandasExecutionEngine
@@ -8,6 +10,11 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     column_condition_partial,
 )
 
+# Fills in fields missing from a value. Without it dateutil calls datetime.now() per value, and
+# partial dates like "31" or "Feb 29" pass or fail depending on the current month. 2000-01-01 is
+# in a leap year and a 31-day month, so any day that exists in some month and year is accepted.
+_DEFAULT_DATETIME = datetime(2000, 1, 1)  # noqa: DTZ001 # only fills missing date fields
+
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.dateutil_parseable"
@@ -16,15 +23,18 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
     def _pandas(cls, column, **kwargs):
         def is_parseable(val):
             try:
-                if type(val) != str:  # noqa: E721 # FIXME CoP
-                    raise TypeError(  # noqa: TRY003 # FIXME CoP
-                        "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."  # noqa: E501 # FIXME CoP
-                    )
-
-                parse(val)
+                parse(val, default=_DEFAULT_DATETIME)
                 return True
 
             except (ValueError, OverflowError):
                 return False
 
-        return column.map(is_parseable)
+        # Checked before unique(), which fails on unhashable values such as lists or dicts
+        if not column.map(lambda val: isinstance(val, str)).all():
+            raise TypeError(  # noqa: TRY003 # FIXME CoP
+                "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."  # noqa: E501 # FIXME CoP
+            )
+
+        # Date-like columns repeat values heavily, so each distinct value is parsed only once
+        parseable_by_value = {val: is_parseable(val) for val in column.unique()}
+        return column.map(parseable_by_value)
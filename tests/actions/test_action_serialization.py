@@ -123,6 +123,7 @@ class TestActionSerialization:
             "name": "my_api_action",
             "type": "api",
             "url": EXAMPLE_URL,
+            "compress_payload": False,
         },
     }
 
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import gzip
+import json
 import logging
 import smtplib
-from contextlib import contextmanager
 from datetime import datetime, timezone
-from types import ModuleType
-from typing import TYPE_CHECKING, Iterator, Literal
+from typing import TYPE_CHECKING, Generator, Literal
 from unittest import mock
 
 import pytest
 import requests
 from requests import Session
+from requests.adapters import HTTPAdapter
 
 import great_expectations as gx
 from great_expectations.checkpoint.actions import (
+    _SMTP_CONNECTIONS,
     ActionContext,
     APINotificationAction,
     EmailAction,
@@ -24,12 +26,16 @@ from great_expectations.checkpoint.actions import (
     SNSNotificationAction,
     UpdateDataDocsAction,
     ValidationAction,
+    _get_sns_client,
+    _SMTPConnectionCache,
 )
 from great_expectations.checkpoint.checkpoint import Checkpoint, CheckpointResult
+from great_expectations.compatibility import aws
 from great_expectations.core.batch import IDDict, LegacyBatchDefinition
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
 )
+from great_expectations.core.http import DEFAULT_TIMEOUT
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.validation_definition import ValidationDefinition
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
@@ -47,11 +53,10 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.exceptions.exceptions import ValidationActionAlreadyRegisteredError
-from great_expectations.util import is_library_loadable
+from great_expectations.render.renderer import SlackRenderer
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
-    from typing_extensions import Never
 
 logger = logging.getLogger(__name__)
 
@@ -166,18 +171,6 @@ def checkpoint_result_with_assets(mocker: MockerFixture):
     )
 
 
-@contextmanager
-def mock_not_imported_module(
-    parent_module: ModuleType, target_name: str, mocker: MockerFixture
-) -> Iterator[Never]:
-    original = getattr(parent_module, target_name)
-    try:
-        setattr(parent_module, target_name, mocker.Mock())
-        yield getattr(parent_module, target_name)
-    finally:
-        setattr(parent_module, target_name, original)
-
-
 class TestAPINotificationAction:
     @pytest.mark.unit
     def test_create_payload(self, mock_context):
@@ -200,28 +193,59 @@ class TestAPINotificationAction:
         url = "http://www.example.com"
         action = APINotificationAction(name="my_action", url=url)
 
-        with mock.patch.object(requests, "post") as mock_post:
+        with mock.patch.object(Session, "post") as mock_post:
             action.run(checkpoint_result=checkpoint_result)
 
         mock_post.assert_called_once_with(
             url,
             headers={"Content-Type": "application/json"},
-            data=[
-                {
-                    "data_asset_name": BATCH_ID_A,
-                    "test_suite_name": SUITE_A,
-                    "validation_results": [],
-                },
-                {
-                    "data_asset_name": BATCH_ID_B,
-                    "test_suite_name": SUITE_B,
-                    "validation_results": [],
-                },
-            ],
+            data=mock.ANY,
         )
+        assert json.loads(mock_post.call_args.kwargs["data"]) == [
+            {
+                "data_asset_name": BATCH_ID_A,
+                "test_suite_name": SUITE_A,
+                "validation_results": [],
+            },
+            {
+                "data_asset_name": BATCH_ID_B,
+                "test_suite_name": SUITE_B,
+                "validation_results": [],
+            },
+        ]
+
+    @pytest.mark.unit
+    def test_run_compresses_large_payload(
+        self, checkpoint_result: CheckpointResult, mocked_posthog
+    ):
+        url = "http://www.example.com"
+        action = APINotificationAction(name="my_action", url=url, compress_payload=True)
+        payload = {"validation_results": "x" * 5000}
+
+        with (
+            mock.patch.object(APINotificationAction, "create_payload", return_value=payload),
+            mock.patch.object(Session, "post") as mock_post,
+        ):
+            action.run(checkpoint_result=checkpoint_result)
+
+        assert mock_post.call_args.kwargs["headers"] == {
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+        assert json.loads(gzip.decompress(mock_post.call_args.kwargs["data"])) == [
+            payload,
+            payload,
+        ]
 
 
 class TestEmailAction:
+    @pytest.fixture(autouse=True)
+    def clear_smtp_connections(self) -> Generator[None, None, None]:
+        # Cached connections are module state; keep each test's mocked SMTP servers to itself
+        _SMTP_CONNECTIONS.close_all()
+        yield
+        _SMTP_CONNECTIONS.close_all()
+
     @pytest.mark.unit
     def test_equality(self):
         """I know, this one seems silly. But this was a bug."""
@@ -255,6 +279,11 @@ class TestEmailAction:
                 ["test1@gmail.com", "test2@hotmail.com"],
                 id="multiple_emails_no_space",
             ),
+            pytest.param(
+                "test1@gmail.com, test2@hotmail.com, test1@gmail.com,",
+                ["test1@gmail.com", "test2@hotmail.com"],
+                id="duplicate_and_trailing_emails",
+            ),
         ],
     )
     def test_run(
@@ -337,6 +366,121 @@ class TestEmailAction:
             mock.ANY,
         )
 
+    @pytest.mark.unit
+    def test_run_reuses_ssl_context(self, checkpoint_result: CheckpointResult, mocked_posthog):
+        action = EmailAction(
+            name="my_action",
+            smtp_address="test",
+            smtp_port="465",
+            receiver_emails="test@gmail.com",
+            use_ssl=True,
+        )
+
+        with mock.patch.object(smtplib, "SMTP_SSL") as mock_server:
+            action.run(checkpoint_result=checkpoint_result)
+            # Force a second handshake so the context is looked up again
+            _SMTP_CONNECTIONS.close_all()
+            action.run(checkpoint_result=checkpoint_result)
+
+        first_call, second_call = mock_server.call_args_list
+        assert first_call.kwargs["context"] is second_call.kwargs["context"]
+
+    @pytest.mark.unit
+    def test_run_reuses_smtp_connection(self, checkpoint_result: CheckpointResult, mocked_posthog):
+        action = EmailAction(
+            name="my_action",
+            smtp_address="reused.example.com",
+            smtp_port="587",
+            receiver_emails="test@gmail.com",
+        )
+
+        with mock.patch.object(smtplib, "SMTP") as mock_server:
+            mock_server.return_value.noop.return_value = (250, b"OK")
+            action.run(checkpoint_result=checkpoint_result)
+            action.run(checkpoint_result=checkpoint_result)
+            _SMTP_CONNECTIONS.close_all()
+
+        mock_server.assert_called_once_with("reused.example.com", "587", timeout=20)
+        assert mock_server.return_value.sendmail.call_count == 2
+        mock_server.return_value.quit.assert_called_once()
+
+    @pytest.mark.unit
+    def test_run_reconnects_when_cached_connection_is_dead(
+        self, checkpoint_result: CheckpointResult, mocked_posthog
+    ):
+        action = EmailAction(
+            name="my_action",
+            smtp_address="dead.example.com",
+            smtp_port="587",
+            receiver_emails="test@gmail.com",
+        )
+
+        with mock.patch.object(smtplib, "SMTP") as mock_server:
+            mock_server.return_value.noop.side_effect = smtplib.SMTPServerDisconnected()
+            action.run(checkpoint_result=checkpoint_result)
+            action.run(checkpoint_result=checkpoint_result)
+
+        assert mock_server.call_count == 2
+        assert mock_server.return_value.sendmail.call_count == 2
+        mock_server.return_value.quit.assert_not_called()
+
+    @pytest.mark.unit
+    def test_run_reconnects_when_cached_connection_drops_during_send(
+        self, checkpoint_result: CheckpointResult, mocked_posthog
+    ):
+        action = EmailAction(
+            name="my_action",
+            smtp_address="dropped.example.com",
+            smtp_port="587",
+            receiver_emails="test@gmail.com",
+        )
+
+        with mock.patch.object(smtplib, "SMTP") as mock_server:
+            mock_server.return_value.noop.return_value = (250, b"OK")
+            mock_server.return_value.sendmail.side_effect = [
+                {},
+                smtplib.SMTPServerDisconnected(),
+                {},
+            ]
+            action.run(checkpoint_result=checkpoint_result)
+            result = action.run(checkpoint_result=checkpoint_result)
+
+        assert result == {"email_result": "success"}
+        assert mock_server.call_count == 2
+        assert mock_server.return_value.sendmail.call_count == 3
+        mock_server.return_value.close.assert_called_once()
+
+    @pytest.mark.unit
+    def test_run_closes_connection_when_send_fails(
+        self, checkpoint_result: CheckpointResult, mocked_posthog
+    ):
+        action = EmailAction(
+            name="my_action",
+            smtp_address="refused.example.com",
+            smtp_port="587",
+            receiver_emails="test@gmail.com",
+        )
+
+        with mock.patch.object(smtplib, "SMTP") as mock_server:
+            mock_server.return_value.sendmail.side_effect = smtplib.SMTPRecipientsRefused({})
+            result = action.run(checkpoint_result=checkpoint_result)
+            _SMTP_CONNECTIONS.close_all()
+
+        assert result == {"email_result": None}
+        mock_server.return_value.close.assert_called_once()
+        mock_server.return_value.quit.assert_not_called()
+
+    @pytest.mark.unit
+    def test_close_all_skips_quit_for_expired_connections(self, mocker: MockerFixture):
+        cache = _SMTPConnectionCache(idle_timeout=-1)
+        mailserver = mocker.MagicMock(spec=smtplib.SMTP)
+        cache.checkin(("expired.example.com", "587"), mailserver)
+
+        cache.close_all()
+
+        mailserver.close.assert_called_once()
+        mailserver.quit.assert_not_called()
+
 
 class TestMicrosoftTeamsNotificationAction:
     @pytest.mark.unit
@@ -465,19 +609,41 @@ class TestOpsgenieAlertAction:
         assert message in mock_post.call_args.kwargs["json"]["message"]
         assert output == {"opsgenie_alert_result": True}
 
+    @pytest.mark.unit
+    def test_run_sends_configured_settings(self, checkpoint_result: CheckpointResult):
+        action = OpsgenieAlertAction(
+            name="my_action",
+            api_key="test",
+            region="eu",
+            priority="P1",
+            tags=["gx", "prod"],
+            notify_on="all",
+        )
+
+        with mock.patch.object(Session, "post") as mock_post:
+            action.run(checkpoint_result=checkpoint_result)
+
+        mock_post.assert_called_once_with(
+            "https://api.eu.opsgenie.com/v2/alerts",
+            headers={"Authorization": "GenieKey test"},
+            json={
+                "message": mock.ANY,
+                "description": mock.ANY,
+                "priority": "P1",
+                "tags": ["gx", "prod"],
+            },
+        )
+
 
 class TestPagerdutyAlertAction:
     @pytest.mark.unit
-    def test_run_emits_events(self, checkpoint_result: CheckpointResult, mocker: MockerFixture):
-        from great_expectations.checkpoint import actions
-
-        with mock_not_imported_module(actions, "pypd", mocker):
-            mock_pypd_event = actions.pypd.EventV2.create
-            action = PagerdutyAlertAction(
-                name="my_action", api_key="test", routing_key="test", notify_on="all"
-            )
-            checkpoint_name = checkpoint_result.checkpoint_config.name
+    def test_run_emits_events(self, checkpoint_result: CheckpointResult):
+        action = PagerdutyAlertAction(
+            name="my_action", api_key="test", routing_key="test", notify_on="all"
+        )
+        checkpoint_name = checkpoint_result.checkpoint_config.name
 
+        with mock.patch.object(Session, "post") as mock_post:
             checkpoint_result.success = True
             assert action.run(checkpoint_result=checkpoint_result) == {
                 "pagerduty_alert_result": "success"
@@ -488,53 +654,67 @@ class TestPagerdutyAlertAction:
                 "pagerduty_alert_result": "success"
             }
 
-            assert mock_pypd_event.call_count == 2
-            mock_pypd_event.assert_has_calls(
-                [
-                    mock.call(
-                        data={
-                            "dedup_key": checkpoint_name,
-                            "event_action": "trigger",
-                            "payload": {
-                                "severity": "critical",
-                                "source": "Great Expectations",
-                                "summary": f"Great Expectations Checkpoint {checkpoint_name} has succeeded",  # noqa: E501 # FIXME CoP
-                            },
-                            "routing_key": "test",
-                        }
-                    ),
-                    mock.call(
-                        data={
-                            "dedup_key": checkpoint_name,
-                            "event_action": "trigger",
-                            "payload": {
-                                "severity": "critical",
-                                "source": "Great Expectations",
-                                "summary": f"Great Expectations Checkpoint {checkpoint_name} has failed",  # noqa: E501 # FIXME CoP
-                            },
-                            "routing_key": "test",
-                        }
-                    ),
-                ]
-            )
+        assert mock_post.call_count == 2
+        mock_post.assert_has_calls(
+            [
+                mock.call(
+                    url="https://events.pagerduty.com/v2/enqueue",
+                    json={
+                        "dedup_key": checkpoint_name,
+                        "event_action": "trigger",
+                        "payload": {
+                            "severity": "critical",
+                            "source": "Great Expectations",
+                            "summary": f"Great Expectations Checkpoint {checkpoint_name} has succeeded",  # noqa: E501 # FIXME CoP
+                        },
+                        "routing_key": "test",
+                    },
+                ),
+                mock.call().raise_for_status(),
+                mock.call(
+                    url="https://events.pagerduty.com/v2/enqueue",
+                    json={
+                        "dedup_key": checkpoint_name,
+                        "event_action": "trigger",
+                        "payload": {
+                            "severity": "critical",
+                            "source": "Great Expectations",
+                            "summary": f"Great Expectations Checkpoint {checkpoint_name} has failed",  # noqa: E501 # FIXME CoP
+                        },
+                        "routing_key": "test",
+                    },
+                ),
+                mock.call().raise_for_status(),
+            ]
+        )
 
-    @pytest.mark.skipif(
-        not is_library_loadable(library_name="pypd"),
-        reason="pypd is not installed",
-    )
-    @mock.patch("pypd.EventV2.create")
     @pytest.mark.unit
-    def test_run_does_not_emit_events(self, mock_pypd_event, checkpoint_result: CheckpointResult):
+    def test_run_does_not_emit_events(self, checkpoint_result: CheckpointResult):
         action = PagerdutyAlertAction(
             name="my_action", api_key="test", routing_key="test", notify_on="failure"
         )
 
         checkpoint_result.success = True
-        assert action.run(checkpoint_result=checkpoint_result) == {
-            "pagerduty_alert_result": "none sent"
-        }
+        with mock.patch.object(Session, "post") as mock_post:
+            assert action.run(checkpoint_result=checkpoint_result) == {
+                "pagerduty_alert_result": "none sent"
+            }
 
-        mock_pypd_event.assert_not_called()
+        mock_post.assert_not_called()
+
+    @pytest.mark.unit
+    def test_run_http_error(self, checkpoint_result: CheckpointResult, caplog):
+        action = PagerdutyAlertAction(
+            name="my_action", api_key="test", routing_key="test", notify_on="all"
+        )
+
+        with mock.patch.object(Session, "post") as mock_post, caplog.at_level(logging.WARNING):
+            mock_post.return_value.raise_for_status.side_effect = requests.HTTPError("bad key")
+            mock_post.return_value.status_code = 400
+            output = action.run(checkpoint_result=checkpoint_result)
+
+        assert output == {"pagerduty_alert_result": None}
+        assert caplog.records[-1].message.startswith("Request to PagerDuty API returned error 400")
 
 
 class TestSlackNotificationAction:
@@ -727,8 +907,69 @@ class TestSlackNotificationAction:
         mock_context.config_provider.substitute_config.assert_any_call("${SLACK_CHANNEL}")
         mock_context.config_provider.substitute_config.assert_any_call("${SLACK_TOKEN}")
 
+    @pytest.mark.unit
+    def test_run_reuses_pooled_session(self, checkpoint_result, mocked_posthog):
+        action = SlackNotificationAction(name="my_action", slack_webhook="test", notify_on="all")
+
+        with mock.patch(
+            "great_expectations.checkpoint.actions._NOTIFICATION_SESSION"
+        ) as mock_session:
+            action.run(checkpoint_result)
+            action.run(checkpoint_result)
+
+        assert mock_session.post.call_count == 2
+
+    @pytest.mark.unit
+    def test_pooled_session_applies_default_timeout(self):
+        from great_expectations.checkpoint import actions
+
+        response = requests.Response()
+        response.status_code = 200
+        with mock.patch.object(HTTPAdapter, "send", return_value=response) as mock_send:
+            actions._NOTIFICATION_SESSION.post("https://hooks.slack.com/test", json={})
+
+        assert mock_send.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+    @pytest.mark.unit
+    def test_pooled_session_keeps_explicit_timeout(self):
+        from great_expectations.checkpoint import actions
+
+        response = requests.Response()
+        response.status_code = 200
+        with mock.patch.object(HTTPAdapter, "send", return_value=response) as mock_send:
+            actions._NOTIFICATION_SESSION.post("https://hooks.slack.com/test", json={}, timeout=5)
+
+        assert mock_send.call_args.kwargs["timeout"] == 5
+
+    @pytest.mark.unit
+    def test_run_splits_payload_over_block_limit(self, checkpoint_result, mocked_posthog):
+        action = SlackNotificationAction(name="my_action", slack_webhook="test", notify_on="all")
+        blocks = [{"type": "divider"}] * 120
+
+        with (
+            mock.patch.object(
+                SlackRenderer, "concatenate_text_blocks", return_value={"blocks": blocks}
+            ),
+            mock.patch.object(Session, "post") as mock_post,
+        ):
+            output = action.run(checkpoint_result)
+
+        assert [len(call.kwargs["json"]["blocks"]) for call in mock_post.call_args_list] == [
+            50,
+            50,
+            20,
+        ]
+        assert output == {"slack_notification_result": "Slack notification succeeded."}
+
 
 class TestSNSNotificationAction:
+    @pytest.fixture(autouse=True)
+    def clear_sns_clients(self) -> Generator[None, None, None]:
+        # Cached clients hold the credentials of the test that built them
+        _get_sns_client.cache_clear()
+        yield
+        _get_sns_client.cache_clear()
+
     @pytest.mark.unit
     def test_run(self, sns, checkpoint_result: CheckpointResult, mocked_posthog):
         subj_topic = "test-subj"
@@ -743,6 +984,21 @@ class TestSNSNotificationAction:
         result = action.run(checkpoint_result=checkpoint_result)
         assert "Successfully posted results" in result["result"]
 
+    @pytest.mark.unit
+    def test_run_reuses_client(self, sns, checkpoint_result: CheckpointResult, mocked_posthog):
+        arn = sns.create_topic(Name="test-subj").get("TopicArn")
+        action = SNSNotificationAction(
+            name="my_action",
+            sns_topic_arn=arn,
+            sns_message_subject="Subject",
+        )
+
+        with mock.patch.object(aws.boto3, "Session", wraps=aws.boto3.Session) as mock_session:
+            action.run(checkpoint_result=checkpoint_result)
+            action.run(checkpoint_result=checkpoint_result)
+
+        mock_session.assert_called_once_with()
+
 
 class TestUpdateDataDocsAction:
     @pytest.mark.unit
@@ -783,30 +1039,16 @@ class TestUpdateDataDocsAction:
         validation_identifier_a, validation_identifier_b = tuple(
             checkpoint_result.run_results.keys()
         )
-        assert (
-            context.build_data_docs.call_count == 2
-        ), "Data Docs should be incrementally built (once per validation result)"
-        context.build_data_docs.assert_has_calls(
-            [
-                mock.call(
-                    build_index=True,
-                    dry_run=False,
-                    resource_identifiers=[
-                        validation_identifier_a,
-                        ExpectationSuiteIdentifier(name=SUITE_A),
-                    ],
-                    site_names=site_names,
-                ),
-                mock.call(
-                    build_index=True,
-                    dry_run=False,
-                    resource_identifiers=[
-                        validation_identifier_b,
-                        ExpectationSuiteIdentifier(name=SUITE_B),
-                    ],
-                    site_names=site_names,
-                ),
-            ]
+        context.build_data_docs.assert_called_once_with(
+            build_index=True,
+            dry_run=False,
+            resource_identifiers=[
+                validation_identifier_a,
+                ExpectationSuiteIdentifier(name=SUITE_A),
+                validation_identifier_b,
+                ExpectationSuiteIdentifier(name=SUITE_B),
+            ],
+            site_names=site_names,
         )
         assert res == {
             validation_identifier_a: {
@@ -851,36 +1093,22 @@ class TestUpdateDataDocsAction:
         validation_identifier_a, validation_identifier_b = tuple(
             checkpoint_result.run_results.keys()
         )
-        assert (
-            context.build_data_docs.call_count == 2
-        ), "Data Docs should be incrementally built (once per validation result)"
-        context.build_data_docs.assert_has_calls(
-            [
-                mock.call(
-                    build_index=True,
-                    dry_run=False,
-                    resource_identifiers=[
-                        validation_identifier_a,
-                        GXCloudIdentifier(
-                            resource_type=GXCloudRESTResource.EXPECTATION_SUITE,
-                            resource_name=SUITE_A,
-                        ),
-                    ],
-                    site_names=site_names,
+        context.build_data_docs.assert_called_once_with(
+            build_index=True,
+            dry_run=False,
+            resource_identifiers=[
+                validation_identifier_a,
+                GXCloudIdentifier(
+                    resource_type=GXCloudRESTResource.EXPECTATION_SUITE,
+                    resource_name=SUITE_A,
                 ),
-                mock.call(
-                    build_index=True,
-                    dry_run=False,
-                    resource_identifiers=[
-                        validation_identifier_b,
-                        GXCloudIdentifier(
-                            resource_type=GXCloudRESTResource.EXPECTATION_SUITE,
-                            resource_name=SUITE_B,
-                        ),
-                    ],
-                    site_names=site_names,
+                validation_identifier_b,
+                GXCloudIdentifier(
+                    resource_type=GXCloudRESTResource.EXPECTATION_SUITE,
+                    resource_name=SUITE_B,
                 ),
-            ]
+            ],
+            site_names=site_names,
         )
         assert res == {
             validation_identifier_a: {},
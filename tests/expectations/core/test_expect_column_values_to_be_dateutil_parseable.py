@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations.expectations as gxe
+from great_expectations.data_context.data_context.abstract_data_context import AbstractDataContext
+
+
+def _validate(context: AbstractDataContext, df: pd.DataFrame):
+    data_asset = context.data_sources.pandas_default.add_dataframe_asset("my_dataframe")
+    batch = data_asset.add_batch_definition_whole_dataframe("my_batch_definition").get_batch(
+        batch_parameters={"dataframe": df}
+    )
+    return batch.validate(
+        gxe.ExpectColumnValuesToBeDateutilParseable(column="a"),
+        result_format="COMPLETE",
+    )
+
+
+@pytest.mark.big
+def test_expect_column_values_to_be_dateutil_parseable_repeated_values(
+    empty_data_context: AbstractDataContext,
+):
+    df = pd.DataFrame({"a": ["2019-04-01", "abc", "2019-04-01", "abc", "01/01/2010", "2019-04-01"]})
+
+    result = _validate(empty_data_context, df)
+
+    assert not result.success
+    assert result.result["unexpected_count"] == 2
+    assert result.result["unexpected_index_list"] == [1, 3]
+
+
+@pytest.mark.big
+def test_expect_column_values_to_be_dateutil_parseable_numpy_str(
+    empty_data_context: AbstractDataContext,
+):
+    # pandas turns numpy unicode arrays into python strings, so build the numpy.str_ values directly
+    values = [np.str_("2019-04-01"), np.str_("01/01/2010"), np.str_("abc"), np.str_("abc")]
+    df = pd.DataFrame({"a": pd.Series(values, dtype=object)})
+    assert isinstance(df["a"].iloc[0], np.str_)
+
+    result = _validate(empty_data_context, df)
+
+    assert not result.success
+    assert result.result["unexpected_count"] == 2
+    assert result.result["unexpected_index_list"] == [2, 3]
+
+
+@pytest.mark.big
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param([1, 2, 3, 4], id="integers"),
+        pytest.param([["2019-04-01"], ["abc"], ["abc"], ["2019-04-02"]], id="lists"),
+    ],
+)
+def test_expect_column_values_to_be_dateutil_parseable_non_string_raises(
+    empty_data_context: AbstractDataContext, values: list
+):
+    df = pd.DataFrame({"a": values})
+
+    result = _validate(empty_data_context, df)
+
+    assert result.success is False
+    for v in result.exception_info.values():
+        assert v["raised_exception"] is True
+        assert (
+            "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string."
+            in v["exception_message"]
+        )
@@ -25,7 +25,7 @@ from tests.integration.test_utils.data_source_config.base import BatchTestSetup,
 if TYPE_CHECKING:
     import pandas as pd
 
-    from great_expectations.compatibility.sqlalchemy import TypeEngine
+    from great_expectations.compatibility.sqlalchemy import Engine, TypeEngine
 
 
 @dataclass(frozen=True)
@@ -119,9 +119,17 @@ class SQLBatchTestSetup(BatchTestSetup[_ConfigT, TableAsset], ABC, Generic[_Conf
         else:
             return None
 
+    def _create_engine(self) -> Engine:
+        """Engine used to create and drop the test tables."""
+        return create_engine(url=self.connection_string)
+
+    def _release_engine(self, engine: Engine) -> None:
+        """Called once setup or teardown is done with the engine."""
+        engine.dispose()
+
     @override
     def setup(self) -> None:
-        engine = create_engine(url=self.connection_string)
+        engine = self._create_engine()
         with engine.connect() as conn, conn.begin():
             # create schema if needed
 
@@ -142,17 +150,17 @@ class SQLBatchTestSetup(BatchTestSetup[_ConfigT, TableAsset], ABC, Generic[_Conf
                 df = table_data.df.replace(np.nan, None)
                 values = list(df.to_dict("index").values())
                 conn.execute(insert(table_data.table), values)
-        engine.dispose()
+        self._release_engine(engine)
 
     @override
     def teardown(self) -> None:
-        engine = create_engine(url=self.connection_string)
+        engine = self._create_engine()
         for table in self.tables:
             table.drop(engine)
         if self.schema:
             with engine.connect() as conn, conn.begin():
                 conn.execute(TextClause(f"DROP SCHEMA {self.schema}"))
-        engine.dispose()
+        self._release_engine(engine)
 
     def _create_table_name(self, label: Optional[str] = None) -> str:
         parts = ["expectation_test_table", label, self._random_resource_name()]